@@ -16,19 +16,54 @@ the REST API and Streamlit dashboard.
 
 import pandas as pd
 import numpy as np
+from pandas._libs.parsers import STR_NA_VALUES
 from scipy import stats
 from datetime import datetime
+import functools
 import logging
 import os
-from typing import Dict, List, Tuple, Optional
+import pickle
+import tempfile
+from typing import Dict, List, NamedTuple, Tuple, Optional
 
+# pyarrow is optional: when installed, CSVs are parsed with Arrow's multithreaded reader,
+# which also infers dates, integers and booleans natively
+try:
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa_csv = None
 
-def load_data(file_path="data/clinical_trials.csv"):
+# Cell values treated as missing data: pandas' default NA markers (NaN, NULL, "#N/A",
+# "-nan", "1.#QNAN", empty strings, ...) plus the project's extra "Null" and " ", so the
+# pyarrow and pandas readers both match what pd.read_csv has always treated as missing
+_NULL_VALUES = sorted(STR_NA_VALUES | {' ', 'Null'})
+
+# Age group boundaries: each group covers (lower edge, upper edge], like pd.cut bins
+_AGE_BIN_EDGES = np.array([0, 30, 50, 70, 100])
+_AGE_GROUP_LABELS = ['18-30', '31-50', '51-70', '71-80']
+
+# Format version of the on-disk caches written next to the CSV, part of their file names.
+# Bump it whenever the cleaning or analytics output changes, so a deploy never serves
+# results cached by older code.
+_CACHE_VERSION = 'v3'
+
+# Finest grouping used by the analytics; site, age group and monthly tables are marginals of it
+_GROUP_KEYS = ['trial_site', 'age_group', 'enrollment_month']
+
+# Values treated as True in the adverse_event/completed_trial columns once stripped and
+# lowercased (so " True", "YES " and values parsed as bool/int match); anything else is False
+_TRUTHY = frozenset({'true', '1', 'yes'})
+
+
+def load_data(file_path="data/clinical_trials.csv", cache=True):
     """
     Load and preprocess clinical trial data from CSV file with simple error handling.
     
     Args:
-        file_path (str): Path to the CSV file to load. Defaults to "data/clinical_trials.csv"
+        file_path (str or file-like): Path to the CSV file to load, or a binary buffer
+            holding CSV data (e.g. an uploaded file). Defaults to "data/clinical_trials.csv"
+        cache (bool): Reuse the parsed DataFrame while the file is unchanged. Pass False
+            for one-off files. Buffers are never cached. Defaults to True
     
     This function:
     1. Reads the clinical trials CSV file
@@ -38,25 +73,107 @@ def load_data(file_path="data/clinical_trials.csv"):
     5. Creates age groups for analysis (18-30, 31-50, 51-70, 71-80)
     6. Extracts enrollment month for temporal analysis
     
+    Cached results are keyed on (file_path, modification time), so repeated calls on
+    an unchanged file return the already-parsed DataFrame. A cached DataFrame is
+    shared between callers and must not be modified in place. When pyarrow is
+    installed, the cleaned data is also written to a Parquet file next to the CSV
+    (file_path + ".<_CACHE_VERSION>.parquet") so other processes and
+    restarts skip the CSV parse.
+    
     Returns:
         pd.DataFrame: Preprocessed clinical trial data with additional columns
     """
+    if not cache or not isinstance(file_path, (str, os.PathLike)):
+        return _read_and_clean(file_path)
+    
+    # Key the cache on the file's modification time so an edited CSV is re-read
+    return _load_data_cached(file_path, _source_mtime(file_path))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_data_cached(file_path, mtime):
+    """
+    Cached wrapper around _read_and_clean, backed by an on-disk Parquet copy of the
+    cleaned data. The Parquet file is reused while it was built from this exact
+    version of the CSV (see _cache_is_fresh).
+    """
+    # Parquet support comes with pyarrow, so skip the disk cache without it
+    if pa_csv is None:
+        return _read_and_clean(file_path)
+    
+    cache_path = f"{os.fspath(file_path)}.{_CACHE_VERSION}.parquet"
+    if _cache_is_fresh(cache_path, mtime):
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            print(f"Ignoring unreadable cache file {cache_path}: {str(e)}")
+    
+    df = _read_and_clean(file_path)
+    _write_cache_file(cache_path, lambda path: df.to_parquet(path, compression='zstd'), mtime)
+    return df
+
+
+def _source_mtime(file_path):
+    """Return the modification time of file_path in integer nanoseconds."""
+    return os.stat(file_path).st_mtime_ns
+
+
+def _cache_is_fresh(cache_path, mtime):
+    """
+    Return True if cache_path exists and was built from the source version modified at
+    mtime. _write_cache_file stamps each cache file with its source's modification
+    time, so an exact match ties the cache to that version; a newer cache built from
+    an older CSV (e.g. one rewritten mid-build) is never mistaken for fresh.
+    """
+    try:
+        return os.stat(cache_path).st_mtime_ns == mtime
+    except OSError:
+        return False
+
+
+def _write_cache_file(cache_path, write, mtime):
+    """
+    Create cache_path by calling write(path) on a uniquely named temporary file and
+    renaming it into place, so concurrent workers and threads never read a half-written
+    cache. The file is stamped with mtime, the modification time of the source version
+    it was built from. Failures (e.g. a read-only data directory) are reported and
+    otherwise ignored.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(cache_path) or '.',
+        prefix=os.path.basename(cache_path) + '.',
+        suffix='.tmp'
+    )
+    os.close(fd)
     try:
-        # Read the clinical trials data from CSV
-        df = pd.read_csv(file_path)
+        write(tmp_path)
+        os.utime(tmp_path, ns=(mtime, mtime))
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Could not write cache file {cache_path}: {str(e)}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _read_and_clean(file_path):
+    """Read the CSV path or buffer file_path and run the cleaning steps described in load_data."""
+    try:
+        # Read the clinical trials data from CSV; null representations are mapped
+        # to missing values by the reader itself
+        df = _read_csv(file_path)
         
         # Simple error handling: drop rows and columns with missing data
         original_rows = len(df)
         original_cols = len(df.columns)
         
-        # Handle various null representations (None, NaN, "Null", "null", empty strings)
-        df = df.replace(['Null', 'null', 'NULL', '', ' '], pd.NA)
-        
-        # Drop columns that are completely empty
-        df = df.dropna(axis=1, how='all')
-        
-        # Drop rows that have any missing data
-        df = df.dropna(axis=0, how='any')
+        # Only rebuild the frame when something is actually missing; clean files
+        # skip both dropna passes below
+        if df.isna().any().any():
+            # Drop columns that are completely empty
+            df = df.dropna(axis=1, how='all')
+            
+            # Drop rows that have any missing data
+            df = df.dropna(axis=0, how='any')
         
         # Log data cleaning results
         if len(df) < original_rows or len(df.columns) < original_cols:
@@ -64,28 +181,45 @@ def load_data(file_path="data/clinical_trials.csv"):
         
         # Convert enrollment_date from string to datetime for proper date handling
         # Use errors='coerce' to handle any remaining invalid dates gracefully
+        # (a no-op when the reader already parsed the column as dates)
         df['enrollment_date'] = pd.to_datetime(df['enrollment_date'], errors='coerce')
         
         # Convert age to numeric, handling any remaining string values
         df['age'] = pd.to_numeric(df['age'], errors='coerce')
         
-        # Convert boolean columns, handling various representations
-        df['adverse_event'] = df['adverse_event'].astype(str).str.lower().str.strip()
-        df['adverse_event'] = df['adverse_event'].isin(['true', '1', 'yes'])
-        
-        df['completed_trial'] = df['completed_trial'].astype(str).str.lower().str.strip()
-        df['completed_trial'] = df['completed_trial'].isin(['true', '1', 'yes'])
+        # Convert boolean columns in a single pass: only the column's few distinct values
+        # are normalized (stripped, lowercased) and looked up in _TRUTHY, and the result
+        # is broadcast back to every row through the factorized codes.
+        # Columns the reader already parsed as plain NumPy bool are left as they are;
+        # anything else, including pandas' nullable "boolean" dtype, goes through the
+        # lookup, so both columns always end up as np.bool_ and reductions on them take
+        # NumPy's fast path instead of the masked-array one
+        for col in ['adverse_event', 'completed_trial']:
+            if df[col].dtype != np.bool_:
+                codes, uniques = pd.factorize(df[col])
+                # The trailing False is picked by code -1 (missing values)
+                flags = np.array([str(value).strip().lower() in _TRUTHY for value in uniques] + [False])
+                df[col] = flags.take(codes)
         
         # Drop any rows where date or age conversion failed
         df = df.dropna(subset=['enrollment_date', 'age'])
         
-        # Create age groups using pandas cut function for categorical analysis
-        # Bins: 0-30, 31-50, 51-70, 71-80 (labels correspond to age ranges)
-        df['age_group'] = pd.cut(df['age'], bins=[0, 30, 50, 70, 100], labels=['18-30', '31-50', '51-70', '71-80'])
+        # Create age groups for categorical analysis by locating each age between the
+        # bin edges; the integer positions become the categorical codes directly
+        # Bins: 0-30, 31-50, 51-70, 71-80 (ages outside 1-100 get no group)
+        codes = np.searchsorted(_AGE_BIN_EDGES, df['age'].to_numpy(), side='left') - 1
+        codes[codes >= len(_AGE_GROUP_LABELS)] = -1
+        df['age_group'] = pd.Categorical.from_codes(codes, categories=_AGE_GROUP_LABELS, ordered=True)
         
         # Extract enrollment month for temporal trend analysis
         df['enrollment_month'] = df['enrollment_date'].dt.month
         
+        # Downcast to compact dtypes: category codes make grouping cheaper and the
+        # frame several times smaller (ages use the smallest integer type that fits)
+        df['trial_site'] = df['trial_site'].astype('category')
+        df['age'] = pd.to_numeric(df['age'], downcast='integer')
+        df['enrollment_month'] = df['enrollment_month'].astype('int8')
+        
         return df
         
     except Exception as e:
@@ -93,7 +227,145 @@ def load_data(file_path="data/clinical_trials.csv"):
         raise
 
 
-def calculate_summary_statistics(df):
+def _read_csv(source):
+    """
+    Read raw clinical trial CSV data, treating every entry of _NULL_VALUES as missing.
+    
+    Uses pyarrow's CSV reader when available so clean files arrive with datetime,
+    integer and bool columns already typed; otherwise falls back to pandas' C engine.
+    
+    Args:
+        source (str or file-like): Path or binary buffer containing the CSV data
+        
+    Returns:
+        pd.DataFrame: Raw data, before any cleaning
+    """
+    if pa_csv is None:
+        return pd.read_csv(source, na_values=_NULL_VALUES, keep_default_na=False)
+    
+    convert_options = pa_csv.ConvertOptions(null_values=_NULL_VALUES, strings_can_be_null=True)
+    table = pa_csv.read_csv(source, convert_options=convert_options)
+    return table.to_pandas(date_as_object=False)
+
+
+def _group_totals(df):
+    """
+    Aggregate patient counts, outcome sums and age statistics per
+    (trial site, age group, enrollment month) in a single pass over the data.
+    
+    Site, age group and temporal analyses are all derived from this frame, so
+    get_all_analytics computes it once and shares it instead of re-scanning the
+    data for every analysis. The reductions run as np.bincount over integer cell
+    codes rather than a hash-based groupby.
+    
+    Args:
+        df (pd.DataFrame): Preprocessed clinical trial data
+        
+    Returns:
+        pd.DataFrame: Columns n, comp, ae, age_sum, age_min, age_max indexed by _GROUP_KEYS
+    """
+    # Integer-code each grouping key; missing keys (ages outside the age groups) get an
+    # extra trailing slot so those patients still count towards site and month totals
+    codes, levels = zip(*(pd.factorize(df[key], sort=True) for key in _GROUP_KEYS))
+    shape = tuple(len(level) + 1 for level in levels)
+    slots = tuple(np.where(code < 0, len(level), code) for code, level in zip(codes, levels))
+    cell = np.ravel_multi_index(slots, shape)
+    size = int(np.prod(shape))
+    
+    completed = df['completed_trial'].to_numpy(dtype=bool)
+    adverse = df['adverse_event'].to_numpy(dtype=bool)
+    ages = df['age'].to_numpy(dtype=float)
+    
+    # Accumulate every statistic per cell
+    n = np.bincount(cell, minlength=size)
+    comp = np.bincount(cell[completed], minlength=size)
+    ae = np.bincount(cell[adverse], minlength=size)
+    age_sum = np.bincount(cell, weights=ages, minlength=size)
+    age_min = np.full(size, np.inf)
+    np.minimum.at(age_min, cell, ages)
+    age_max = np.full(size, -np.inf)
+    np.maximum.at(age_max, cell, ages)
+    
+    # Keep the cells that contain patients, indexed like a groupby over _GROUP_KEYS
+    occupied = np.flatnonzero(n)
+    index = pd.MultiIndex(
+        levels=levels,
+        codes=[np.where(slot == len(level), -1, slot)
+               for slot, level in zip(np.unravel_index(occupied, shape), levels)],
+        names=_GROUP_KEYS
+    )
+    return pd.DataFrame({
+        'n': n[occupied],
+        'comp': comp[occupied],
+        'ae': ae[occupied],
+        'age_sum': age_sum[occupied],
+        'age_min': age_min[occupied].astype(df['age'].dtype),
+        'age_max': age_max[occupied].astype(df['age'].dtype)
+    }, index=index)
+
+
+def _marginal(base, key):
+    """Collapse the output of _group_totals onto a single grouping key."""
+    return base.groupby(level=key, observed=True).agg(
+        n=('n', 'sum'),
+        comp=('comp', 'sum'),
+        ae=('ae', 'sum'),
+        age_sum=('age_sum', 'sum'),
+        age_min=('age_min', 'min'),
+        age_max=('age_max', 'max')
+    )
+
+
+def _rate(count, total):
+    """Return count as a percentage of total, or NaN when total is zero."""
+    return count / total * 100 if total else np.nan
+
+
+class OutcomeSummary(NamedTuple):
+    """Patient counts and unrounded rates (percentages) for trial outcomes."""
+    total: int
+    completed: int
+    adverse_events: int
+    completed_with_ae: int
+    completion_rate: float
+    adverse_event_rate: float
+    completion_rate_with_ae: float
+    completion_rate_without_ae: float
+
+
+def outcome_summary(completed, adverse):
+    """
+    Count trial completions and adverse events, and derive the overall and
+    adverse-event-stratified completion rates from those counts.
+    
+    Args:
+        completed (np.ndarray): Boolean completed_trial values
+        adverse (np.ndarray): Boolean adverse_event values
+        
+    Returns:
+        OutcomeSummary: Counts and rates for the given patients
+    """
+    # Encode each patient's (completed, adverse event) pair as a cell 0-3 and count all
+    # four cells in one pass instead of reducing each column (and their overlap) separately
+    cells = (completed.view(np.uint8) << 1) | adverse.view(np.uint8)
+    neither, ae_only, completed_only, both = np.bincount(cells, minlength=4).tolist()
+    
+    total = len(cells)
+    n_completed = completed_only + both
+    n_ae = ae_only + both
+    return OutcomeSummary(
+        total=total,
+        completed=n_completed,
+        adverse_events=n_ae,
+        completed_with_ae=both,
+        completion_rate=_rate(n_completed, total),
+        adverse_event_rate=_rate(n_ae, total),
+        completion_rate_with_ae=_rate(both, n_ae),
+        completion_rate_without_ae=_rate(completed_only, total - n_ae)
+    )
+
+
+def calculate_summary_statistics(df, base=None):
     """
     Calculate basic summary statistics for the clinical trial data.
     
@@ -106,46 +378,41 @@ def calculate_summary_statistics(df):
     
     Args:
         df (pd.DataFrame): Preprocessed clinical trial data
+        base (pd.DataFrame, optional): Precomputed _group_totals(df)
         
     Returns:
         dict: Dictionary containing all summary statistics with rounded values
     """
+    if base is None:
+        base = _group_totals(df)
+    
     # 1. Total number of patients enrolled in the trial
     total_patients = len(df)
     
     # 2. Count patients per trial site for site distribution analysis
-    patients_per_site = (df.groupby("trial_site")["patient_id"].count().reset_index(name="patient_count"))
+    patients_per_site = _marginal(base, 'trial_site')['n'].reset_index(name='patient_count')
     
     # 3. Calculate average age of all patients
     average_age = df["age"].mean()
     
-    # 4. Calculate overall trial completion rate (percentage)
-    completion_rate = df["completed_trial"].mean() * 100
-    
-    # 5. Calculate overall adverse event rate (percentage)
-    adverse_event_rate = df["adverse_event"].mean() * 100
-    
-    # 6. Calculate completion rate for patients who experienced adverse events
-    # This helps understand if adverse events impact trial completion
-    completion_rate_with_ae = df[df["adverse_event"] == True]["completed_trial"].mean() * 100
-    
-    # 7. Calculate completion rate for patients who did NOT experience adverse events
-    # This provides a baseline for comparison
-    completion_rate_without_ae = df[df["adverse_event"] == False]["completed_trial"].mean() * 100
+    # 4-7. Overall completion and adverse event rates, plus completion rates for patients
+    # with and without adverse events (showing whether adverse events impact completion),
+    # all derived from one fused count over the two boolean columns
+    outcomes = outcome_summary(df["completed_trial"].to_numpy(), df["adverse_event"].to_numpy())
     
     # Return structured dictionary with all statistics
     return {
         'total_patients': int(total_patients),
         'patients_per_site': patients_per_site.to_dict('records'),  # Convert to list of dicts for JSON serialization
         'average_age': round(average_age, 1),
-        'completion_rate': round(completion_rate, 1),
-        'adverse_event_rate': round(adverse_event_rate, 1),
-        'completion_rate_with_ae': round(completion_rate_with_ae, 1),
-        'completion_rate_without_ae': round(completion_rate_without_ae, 1)
+        'completion_rate': round(outcomes.completion_rate, 1),
+        'adverse_event_rate': round(outcomes.adverse_event_rate, 1),
+        'completion_rate_with_ae': round(outcomes.completion_rate_with_ae, 1),
+        'completion_rate_without_ae': round(outcomes.completion_rate_without_ae, 1)
     }
 
 
-def site_performance_analysis(df):
+def site_performance_analysis(df, base=None, as_frame=False):
     """
     Perform advanced site performance analysis comparing all trial sites.
     
@@ -158,33 +425,37 @@ def site_performance_analysis(df):
     
     Args:
         df (pd.DataFrame): Preprocessed clinical trial data
+        base (pd.DataFrame, optional): Precomputed _group_totals(df)
+        as_frame (bool): Return the DataFrame the dictionary is built from instead
         
     Returns:
         dict: Dictionary with site names as keys and performance metrics as values
     """
-    # Group data by trial site and calculate multiple aggregations
-    site_stats = df.groupby('trial_site').agg({
-        'patient_id': 'count',           # Count total patients per site
-        'completed_trial': ['sum', 'mean'],  # Sum and mean of completions
-        'adverse_event': ['sum', 'mean'],    # Sum and mean of adverse events
-        'age': 'mean'                    # Average age per site
-    }).round(3)
-    
-    # Flatten column names for easier access
-    site_stats.columns = ['total_patients', 'completed_count', 'completion_rate', 'ae_count', 'ae_rate', 'avg_age']
-    
-    # Convert rates to percentages for better readability
-    site_stats['completion_rate'] = site_stats['completion_rate'] * 100
-    site_stats['ae_rate'] = site_stats['ae_rate'] * 100
+    if base is None:
+        base = _group_totals(df)
+    
+    # Collapse the group totals onto trial site and derive the per-site metrics
+    # Rates are percentages rounded once to one decimal; average ages keep three decimals
+    totals = _marginal(base, 'trial_site')
+    site_stats = pd.DataFrame({
+        'total_patients': totals['n'],                                     # Count total patients per site
+        'completed_count': totals['comp'],                                 # Completions per site
+        'completion_rate': (totals['comp'] / totals['n'] * 100).round(1),  # Completion rate per site
+        'ae_count': totals['ae'],                                          # Adverse events per site
+        'ae_rate': (totals['ae'] / totals['n'] * 100).round(1),            # Adverse event rate per site
+        'avg_age': (totals['age_sum'] / totals['n']).round(3)              # Average age per site
+    })
     
     # Sort sites by completion rate (best performing first)
     site_stats = site_stats.sort_values('completion_rate', ascending=False)
+    if as_frame:
+        return site_stats
     
     # Convert to dictionary format for JSON serialization
     return site_stats.to_dict('index')
 
 
-def age_group_analysis(df):
+def age_group_analysis(df, base=None, as_frame=False):
     """
     Perform detailed analysis of clinical trial outcomes by age groups.
     
@@ -198,30 +469,34 @@ def age_group_analysis(df):
     
     Args:
         df (pd.DataFrame): Preprocessed clinical trial data with age_group column
+        base (pd.DataFrame, optional): Precomputed _group_totals(df)
+        as_frame (bool): Return the DataFrame the dictionary is built from instead
         
     Returns:
         dict: Dictionary with age groups as keys and performance metrics as values
     """
-    # Group data by age group and calculate multiple aggregations
-    age_analysis = df.groupby('age_group').agg({
-        'patient_id': 'count',           # Count patients in each age group
-        'completed_trial': 'mean',       # Completion rate per age group
-        'adverse_event': 'mean',         # Adverse event rate per age group
-        'age': ['min', 'max', 'mean']    # Age statistics for each group
-    }).round(3)
-    
-    # Flatten column names for easier access
-    age_analysis.columns = ['count', 'completion_rate', 'ae_rate', 'min_age', 'max_age', 'avg_age']
-    
-    # Convert rates to percentages for better readability
-    age_analysis['completion_rate'] = age_analysis['completion_rate'] * 100
-    age_analysis['ae_rate'] = age_analysis['ae_rate'] * 100
+    if base is None:
+        base = _group_totals(df)
+    
+    # Collapse the group totals onto age group and derive the per-group metrics
+    # Rates are percentages rounded once to one decimal; average ages keep three decimals
+    totals = _marginal(base, 'age_group')
+    age_analysis = pd.DataFrame({
+        'count': totals['n'],                                              # Count patients in each age group
+        'completion_rate': (totals['comp'] / totals['n'] * 100).round(1),  # Completion rate per age group
+        'ae_rate': (totals['ae'] / totals['n'] * 100).round(1),            # Adverse event rate per age group
+        'min_age': totals['age_min'],                                      # Age statistics for each group
+        'max_age': totals['age_max'],
+        'avg_age': (totals['age_sum'] / totals['n']).round(3)
+    })
+    if as_frame:
+        return age_analysis
     
     # Convert to dictionary format for JSON serialization
     return age_analysis.to_dict('index')
 
 
-def temporal_analysis(df):
+def temporal_analysis(df, base=None, as_frame=False):
     """
     Analyze temporal trends in clinical trial enrollment and outcomes.
     
@@ -235,29 +510,31 @@ def temporal_analysis(df):
     
     Args:
         df (pd.DataFrame): Preprocessed clinical trial data with enrollment_month column
+        base (pd.DataFrame, optional): Precomputed _group_totals(df)
+        as_frame (bool): Return the DataFrame the dictionary is built from instead
         
     Returns:
         dict: Dictionary with months as keys and temporal metrics as values
     """
-    # Group data by enrollment month and calculate aggregations
-    monthly_stats = df.groupby('enrollment_month').agg({
-        'patient_id': 'count',           # Count enrollments per month
-        'completed_trial': 'mean',       # Completion rate per month
-        'adverse_event': 'mean'          # Adverse event rate per month
-    }).round(3)
-    
-    # Rename columns for clarity
-    monthly_stats.columns = ['enrollments', 'completion_rate', 'ae_rate']
-    
-    # Convert rates to percentages for better readability
-    monthly_stats['completion_rate'] = monthly_stats['completion_rate'] * 100
-    monthly_stats['ae_rate'] = monthly_stats['ae_rate'] * 100
+    if base is None:
+        base = _group_totals(df)
+    
+    # Collapse the group totals onto enrollment month and derive the monthly metrics
+    # Rates are percentages, rounded once for readability
+    totals = _marginal(base, 'enrollment_month')
+    monthly_stats = pd.DataFrame({
+        'enrollments': totals['n'],                                        # Count enrollments per month
+        'completion_rate': (totals['comp'] / totals['n'] * 100).round(1),  # Completion rate per month
+        'ae_rate': (totals['ae'] / totals['n'] * 100).round(1)             # Adverse event rate per month
+    })
+    if as_frame:
+        return monthly_stats
     
     # Convert to dictionary format for JSON serialization
     return monthly_stats.to_dict('index')
 
 
-def correlation_analysis(df):
+def correlation_analysis(df, as_frame=False):
     """
     Perform correlation analysis between all variables in the clinical trial data.
     
@@ -273,34 +550,53 @@ def correlation_analysis(df):
     
     Args:
         df (pd.DataFrame): Preprocessed clinical trial data
+        as_frame (bool): Return the correlation matrix as a DataFrame instead
         
     Returns:
         dict: Correlation matrix as a nested dictionary
     """
-    # Create a copy of the data for correlation analysis
-    corr_data = df.copy()
-    
-    # Convert boolean columns to integers for correlation calculation
-    corr_data['completed_trial'] = corr_data['completed_trial'].astype(int)
-    corr_data['adverse_event'] = corr_data['adverse_event'].astype(int)
-    
-    # Ensure enrollment month is available for correlation
-    corr_data['enrollment_month'] = corr_data['enrollment_date'].dt.month
-    
-    # Create dummy variables for trial sites (one-hot encoding)
-    # This allows us to include categorical site data in correlation analysis
-    site_dummies = pd.get_dummies(corr_data['trial_site'], prefix='site')
-    corr_data = pd.concat([corr_data, site_dummies], axis=1)
-    
-    # Select only numeric columns for correlation analysis
-    numeric_cols = ['age', 'completed_trial', 'adverse_event', 'enrollment_month'] + list(site_dummies.columns)
-    correlation_matrix = corr_data[numeric_cols].corr()
+    # Stack the numeric columns (booleans count as 0/1) into one contiguous array and
+    # correlate them with a single np.corrcoef call
+    numeric_cols = ['age', 'completed_trial', 'adverse_event', 'enrollment_month']
+    values = df[numeric_cols].to_numpy(dtype=float)
+    
+    # Trial sites enter the matrix as 0/1 indicator ("dummy") variables. Their Pearson
+    # correlations have closed forms in terms of each site's patient share p and the
+    # per-site means, so the dense N x K dummy matrix is never materialized:
+    #   site vs numeric x:  (mean(x | site) - mean(x)) * sqrt(p / (1 - p)) / std(x)
+    #   site s vs site t:   -sqrt(p_s / (1 - p_s)) * sqrt(p_t / (1 - p_t))
+    site_codes, sites = pd.factorize(df['trial_site'], sort=True)
+    site_counts = np.bincount(site_codes, minlength=len(sites))
+    site_sums = np.column_stack([
+        np.bincount(site_codes, weights=column, minlength=len(sites)) for column in values.T
+    ])
+    share = site_counts / len(values)
+    
+    # Zero-variance columns (or a single site) yield NaN, matching DataFrame.corr()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        numeric_corr = np.corrcoef(values, rowvar=False)
+        odds = np.sqrt(share / (1 - share))
+        site_means = site_sums / site_counts[:, None]
+        site_numeric = (site_means - values.mean(axis=0)) * odds[:, None] / values.std(axis=0)
+        site_site = -np.outer(odds, odds)
+    np.fill_diagonal(site_site, np.where(share < 1, 1.0, np.nan))
+    
+    # Assemble the full matrix in the same layout as a correlation over the dummy columns
+    site_cols = [f'site_{site}' for site in sites]
+    labels = numeric_cols + site_cols
+    correlation_matrix = pd.DataFrame(
+        np.block([[numeric_corr, site_numeric.T], [site_numeric, site_site]]),
+        index=labels,
+        columns=labels
+    )
+    if as_frame:
+        return correlation_matrix
     
     # Convert correlation matrix to dictionary for JSON serialization
     return correlation_matrix.to_dict()
 
 
-def get_key_insights(df):
+def get_key_insights(df, base=None, site_performance=None, age_analysis=None):
     """
     Generate key insights and actionable recommendations from the clinical trial data.
     
@@ -311,17 +607,26 @@ def get_key_insights(df):
     
     Args:
         df (pd.DataFrame): Preprocessed clinical trial data
+        base (pd.DataFrame, optional): Precomputed _group_totals(df)
+        site_performance (dict or pd.DataFrame, optional): Precomputed site_performance_analysis(df)
+        age_analysis (dict or pd.DataFrame, optional): Precomputed age_group_analysis(df)
         
     Returns:
         dict: Dictionary containing insights and recommendations
     """
-    # Get site and age group performance data
-    site_performance = site_performance_analysis(df)
-    age_analysis = age_group_analysis(df)
-    
-    # Convert dictionaries back to DataFrames for easier calculations
-    site_df = pd.DataFrame.from_dict(site_performance, orient='index')
-    age_df = pd.DataFrame.from_dict(age_analysis, orient='index')
+    # Get site and age group performance data, reusing any results the caller already has
+    if (site_performance is None or age_analysis is None) and base is None:
+        base = _group_totals(df)
+    if site_performance is None:
+        site_performance = site_performance_analysis(df, base, as_frame=True)
+    if age_analysis is None:
+        age_analysis = age_group_analysis(df, base, as_frame=True)
+    
+    # Work on DataFrames; results passed in as dictionaries are converted back
+    site_df = (site_performance if isinstance(site_performance, pd.DataFrame)
+               else pd.DataFrame.from_dict(site_performance, orient='index'))
+    age_df = (age_analysis if isinstance(age_analysis, pd.DataFrame)
+              else pd.DataFrame.from_dict(age_analysis, orient='index'))
     
     # Identify best and worst performing sites (sites are already sorted by completion rate)
     best_site = site_df.index[0]      # First site (highest completion rate)
@@ -360,13 +665,20 @@ def get_key_insights(df):
     }
 
 
-def get_all_analytics():
+def get_all_analytics(file_path="data/clinical_trials.csv"):
     """
     Get all analytics in a single function call for comprehensive analysis.
     
     This is a convenience function that runs all analytics functions and returns
     a complete analysis package. Useful for API endpoints that need all data
-    or for generating comprehensive reports.
+    or for generating comprehensive reports. Like load_data, results are cached
+    per (file_path, modification time), both in memory and in a pickle file next
+    to the CSV (file_path + ".analytics.<_CACHE_VERSION>.pkl") that
+    other worker processes reuse. Unpickling can execute code, so the data directory
+    must only be writable by trusted users.
+    
+    Args:
+        file_path (str): Path to the CSV file to analyze. Defaults to "data/clinical_trials.csv"
     
     Returns:
         dict: Dictionary containing all analytics results:
@@ -377,15 +689,53 @@ def get_all_analytics():
             - correlation_analysis: Variable relationships
             - key_insights: Automated insights and recommendations
     """
+    return _get_all_analytics_cached(file_path, _source_mtime(file_path))
+
+
+@functools.lru_cache(maxsize=8)
+def _get_all_analytics_cached(file_path, mtime):
+    """
+    Cached wrapper around _compute_all_analytics, backed by an on-disk pickle of the
+    results. The pickle is reused while it was built from this exact version of the
+    CSV (see _cache_is_fresh).
+    """
+    cache_path = f"{os.fspath(file_path)}.analytics.{_CACHE_VERSION}.pkl"
+    if _cache_is_fresh(cache_path, mtime):
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"Ignoring unreadable cache file {cache_path}: {str(e)}")
+    
+    results = _compute_all_analytics(file_path)
+    
+    def dump(path):
+        # Protocol 5 needs Python 3.8+, the project's minimum version
+        with open(path, 'wb') as f:
+            pickle.dump(results, f, protocol=5)
+    
+    _write_cache_file(cache_path, dump, mtime)
+    return results
+
+
+def _compute_all_analytics(file_path):
+    """Run every analytics function on the data in file_path."""
     # Load and preprocess the data once
-    df = load_data()
+    df = load_data(file_path)
+    
+    # Aggregate the per-group totals once; every grouped analysis is derived from them
+    base = _group_totals(df)
+    
+    # Site and age group results feed the key insights too, so compute them only once
+    site_performance = site_performance_analysis(df, base)
+    age_analysis = age_group_analysis(df, base)
     
     # Run all analytics functions and compile results
     return {
-        'summary_statistics': calculate_summary_statistics(df),
-        'site_performance': site_performance_analysis(df),
-        'age_group_analysis': age_group_analysis(df),
-        'temporal_analysis': temporal_analysis(df),
+        'summary_statistics': calculate_summary_statistics(df, base),
+        'site_performance': site_performance,
+        'age_group_analysis': age_analysis,
+        'temporal_analysis': temporal_analysis(df, base),
         'correlation_analysis': correlation_analysis(df),
-        'key_insights': get_key_insights(df)
+        'key_insights': get_key_insights(df, base, site_performance, age_analysis)
     }
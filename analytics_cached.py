@@ -0,0 +1,115 @@
+"""
+Clinical Trials Analytics (Streamlit-cached)
+
+Streamlit reruns the whole dashboard script on every widget interaction. This module
+re-exports the analytics functions used by the dashboard wrapped in st.cache_data, so
+a rerun on unchanged data is a cache lookup instead of a full recomputation.
+
+The functions keep the signatures and return values of their counterparts in the
+analytics module; only the dashboard should import from here, since the REST API runs
+outside Streamlit.
+"""
+
+import os
+import weakref
+
+import pandas as pd
+import streamlit as st
+
+import analytics
+
+# Seconds a cached result is kept before it is recomputed
+CACHE_TTL = 600
+
+# Maximum number of cached results per function, bounding memory use
+CACHE_MAX_ENTRIES = 16
+
+
+# Data version, (file_path, mtime_ns), of each DataFrame returned by load_data. Keyed by
+# id() with a weak reference that confirms the id still belongs to that frame and
+# drops the entry once the frame is garbage collected.
+_versions = {}
+
+
+def _fingerprint(df):
+    """
+    Cache key for a DataFrame argument. Frames returned by load_data are keyed on
+    their data version in O(1); any other frame falls back to its shape plus one
+    vectorized hash per row and one per column label, which is exact for any data
+    size. The row hashes include the index, since results such as get_key_insights
+    return index labels.
+    """
+    ref, version = _versions.get(id(df), (None, None))
+    if ref is not None and ref() is df:
+        return version
+    rows = pd.util.hash_pandas_object(df).to_numpy().tobytes()
+    columns = pd.util.hash_pandas_object(df.columns).to_numpy().tobytes()
+    return df.shape, rows, columns
+
+
+# Shared st.cache_data settings for every analytics wrapper
+_cache_analytics = st.cache_data(
+    ttl=CACHE_TTL,
+    max_entries=CACHE_MAX_ENTRIES,
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: _fingerprint}
+)
+
+
+def load_data(file_path="data/clinical_trials.csv"):
+    """
+    Cached analytics.load_data. The file's modification time, in integer nanoseconds as
+    used by the analytics module's own caches, is part of the cache key, so an edited
+    CSV is picked up on the next rerun.
+    
+    The returned DataFrame is registered with its (file_path, mtime_ns) version, which the
+    analytics wrappers then use as its cache key instead of hashing the data. It must
+    not be modified in place.
+    """
+    mtime_ns = os.stat(file_path).st_mtime_ns
+    df = _load_data(file_path, mtime_ns)
+    key = id(df)
+    _versions[key] = (weakref.ref(df, lambda _: _versions.pop(key, None)), (file_path, mtime_ns))
+    return df
+
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _load_data(file_path, mtime_ns):
+    """Load file_path once per (file_path, mtime_ns) pair."""
+    return analytics.load_data(file_path)
+
+
+@_cache_analytics
+def calculate_summary_statistics(df):
+    """Cached analytics.calculate_summary_statistics."""
+    return analytics.calculate_summary_statistics(df)
+
+
+@_cache_analytics
+def site_performance_analysis(df, as_frame=False):
+    """Cached analytics.site_performance_analysis."""
+    return analytics.site_performance_analysis(df, as_frame=as_frame)
+
+
+@_cache_analytics
+def age_group_analysis(df, as_frame=False):
+    """Cached analytics.age_group_analysis."""
+    return analytics.age_group_analysis(df, as_frame=as_frame)
+
+
+@_cache_analytics
+def temporal_analysis(df, as_frame=False):
+    """Cached analytics.temporal_analysis."""
+    return analytics.temporal_analysis(df, as_frame=as_frame)
+
+
+@_cache_analytics
+def correlation_analysis(df, as_frame=False):
+    """Cached analytics.correlation_analysis."""
+    return analytics.correlation_analysis(df, as_frame=as_frame)
+
+
+@_cache_analytics
+def get_key_insights(df, site_performance=None, age_analysis=None):
+    """Cached analytics.get_key_insights."""
+    return analytics.get_key_insights(df, site_performance=site_performance, age_analysis=age_analysis)
@@ -12,19 +12,51 @@ All endpoints return JSON responses with proper error handling.
 """
 
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import traceback
+import hashlib
+import io
 import logging
-import os
-import tempfile
+import threading
+from collections import OrderedDict
 from werkzeug.utils import secure_filename
 from analytics import (
     load_data, 
     calculate_summary_statistics
 )
 
+# orjson is optional: when installed, JSON responses are serialized by it instead of
+# the standard library encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    orjson serializes numpy scalars and arrays natively (no conversion to Python objects
+    first) and writes NaN as null, so responses are always valid JSON. Key sorting
+    follows Flask's sort_keys setting, as with the default provider.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask application
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -34,12 +66,17 @@ logger = logging.getLogger(__name__)
 # This allows the API to be accessed from web browsers and other domains
 CORS(app)
 
-# Configuration for file uploads
-UPLOAD_FOLDER = tempfile.gettempdir()
+# Configuration for file uploads (parsed in memory, never written to disk)
 ALLOWED_EXTENSIONS = {'csv'}
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
+# Summary statistics of recently uploaded files, keyed by the MD5 of the file bytes,
+# so re-uploading the same file skips parsing it again. Request threads share it, so
+# every lookup and update holds _upload_cache_lock (parsing happens outside the lock)
+UPLOAD_CACHE_SIZE = 8
+_upload_cache = OrderedDict()
+_upload_cache_lock = threading.Lock()
+
 def allowed_file(filename):
     """Check if the uploaded file has an allowed extension."""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -107,28 +144,45 @@ def upload_csv():
         if not allowed_file(file.filename):
             return jsonify({'error': 'Invalid file type. Only CSV files are allowed.'}), 400
         
-        # Secure the filename and save temporarily
+        # Secure the filename and hash the contents to detect repeated uploads
         filename = secure_filename(file.filename)
-        temp_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(temp_path)
+        content = file.read()
+        digest = hashlib.md5(content).hexdigest()
         
         logger.info(f"Processing uploaded file: {filename}")
         
         try:
-            # Load and validate the uploaded CSV data
-            df = load_data(temp_path)
+            with _upload_cache_lock:
+                cached = _upload_cache.get(digest)
+                if cached is not None:
+                    _upload_cache.move_to_end(digest)
             
-            # Calculate summary statistics
-            stats = calculate_summary_statistics(df)
+            if cached is not None:
+                # Identical file seen recently: skip re-parsing it
+                summary, total_records = cached
+                logger.info(f"Using cached summary for {filename}")
+            else:
+                # Load and validate the uploaded CSV data straight from memory
+                df = load_data(io.BytesIO(content))
+                
+                # Calculate summary statistics
+                summary = calculate_summary_statistics(df)
+                total_records = len(df)
+                
+                with _upload_cache_lock:
+                    _upload_cache[digest] = (summary, total_records)
+                    if len(_upload_cache) > UPLOAD_CACHE_SIZE:
+                        _upload_cache.popitem(last=False)
             
-            # Add file processing info to response
+            # Add file processing info to a copy so the cached summary stays untouched
+            stats = dict(summary)
             stats['file_info'] = {
                 'filename': filename,
-                'total_records': len(df),
+                'total_records': total_records,
                 'status': 'success'
             }
             
-            logger.info(f"Successfully processed {filename} with {len(df)} records")
+            logger.info(f"Successfully processed {filename} with {total_records} records")
             
             return jsonify(stats)
             
@@ -141,12 +195,6 @@ def upload_csv():
                     'status': 'error'
                 }
             }), 400
-            
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-                logger.info(f"Cleaned up temporary file: {temp_path}")
     
     except Exception as e:
         logger.error(f"Unexpected error in upload endpoint: {str(e)}")
@@ -168,6 +216,10 @@ def get_summary_statistics():
     """
     try:
         logger.info("Generating summary statistics from default data file")
+        
+        # The cleaned data is cached per file version (and shared with other workers
+        # through its Parquet file), so only the summary itself is computed here; the
+        # full analytics bundle is not needed for this endpoint
         df = load_data()
         stats = calculate_summary_statistics(df)
         
@@ -193,13 +245,16 @@ if __name__ == '__main__':
     The server will run on:
     - Host: 0.0.0.0 (accessible from all network interfaces)
     - Port: 8000
-    - Debug mode: enabled (for development)
+    - Debug mode: disabled (never expose the debugger on 0.0.0.0)
     
     To run the API:
     flask run --host=0.0.0.0 --port=8000
     
+    For production, serve the app through gunicorn with multiple workers (see wsgi.py):
+    gunicorn -w 4 --threads 2 --preload -b 0.0.0.0:8000 wsgi:app
+    
     Then visit:
     - http://localhost:8000/api/summary for default data summary
     """
     logger.info("Starting Clinical Trials Analytics API on port 8000")
-    app.run(debug=True, host='0.0.0.0', port=8000)
+    app.run(host='0.0.0.0', port=8000)
@@ -6,21 +6,17 @@ It creates realistic patient data including:
 - Patient IDs, trial sites, enrollment dates
 - Patient ages, adverse event status, trial completion status
 
-The data is generated with controlled randomness using seeds for reproducibility.
+All columns are drawn at once from a seeded NumPy random generator, so the output is
+reproducible and generation stays fast even for large record counts.
 """
 
-from faker import Faker
-import random
-import csv
+import numpy as np
+import pandas as pd
 import os
-from datetime import datetime, timedelta
+from datetime import datetime
 
-# Initialize Faker for generating realistic data
-fake = Faker()
-
-# Set seeds for reproducible data generation
-random.seed(42)
-Faker.seed(42)
+# Seeded random generator for reproducible data generation
+rng = np.random.default_rng(42)
 
 # Configuration parameters
 n_records = 40  # Number of patient records to generate
@@ -36,20 +32,21 @@ trial_sites = ["Boston", "Chicago", "New York", "San Francisco", "Dallas"]
 # HELPER FUNCTIONS
 # =============================================================================
 
-def random_date(start_date, end_date):
+def random_dates(start_date, end_date, size):
     """
-    Generate a random date between start_date and end_date.
-    
+    Generate random dates between start_date and end_date (both inclusive).
+
     Args:
         start_date (datetime): Start date for enrollment period
         end_date (datetime): End date for enrollment period
-        
+        size (int): Number of dates to generate
+
     Returns:
-        datetime: Random date within the specified range
+        np.ndarray: datetime64[D] array of random dates within the specified range
     """
-    delta = end_date - start_date
-    random_days = random.randint(0, delta.days)
-    return start_date + timedelta(days=random_days)
+    delta_days = (end_date - start_date).days
+    random_days = rng.integers(0, delta_days + 1, size)
+    return np.datetime64(start_date, 'D') + random_days.astype('timedelta64[D]')
 
 # =============================================================================
 # DATA GENERATION CONFIGURATION
@@ -63,48 +60,39 @@ end_date = datetime(2024, 6, 30)   # Trial end date
 # DATA GENERATION AND CSV CREATION
 # =============================================================================
 
-# Create CSV file with clinical trial data
-with open(output_file, mode="w", newline="") as file:
-    writer = csv.writer(file)
-    
-    # Write CSV header row
-    writer.writerow([
-        "patient_id", "trial_site", "enrollment_date",
-        "age", "adverse_event", "completed_trial"
-    ])
-
-    # Generate patient records
-    for i in range(1, n_records + 1):
-        # Generate patient ID with zero-padding (P001, P002, etc.)
-        patient_id = f"P{i:03d}"
-        
-        # Randomly assign trial site
-        trial_site = random.choice(trial_sites)
-        
-        # Generate random enrollment date within the trial period
-        enrollment_date = random_date(start_date, end_date).strftime("%Y-%m-%d")
-        
-        # Generate patient age (18-80 years old)
-        age = random.randint(18, 80)
-
-        # Generate adverse event status (approximately 30% of patients)
-        adverse_event = random.random() < 0.3
-
-        # Generate completion status with realistic probabilities
-        # Patients with adverse events have lower completion rates
-        if adverse_event:
-            completed_trial = random.random() < 0.7  # 70% completion if adverse event
-        else:
-            completed_trial = random.random() < 0.9  # 90% completion otherwise
-
-        # Write patient record to CSV
-        writer.writerow([
-            patient_id, trial_site, enrollment_date,
-            age, str(adverse_event).lower(), str(completed_trial).lower()
-        ])
+# Generate patient IDs with zero-padding (P001, P002, etc.)
+patient_ids = "P" + pd.Series(np.arange(1, n_records + 1)).astype(str).str.zfill(3)
+
+# Randomly assign trial sites
+sites = rng.choice(trial_sites, n_records)
+
+# Generate random enrollment dates within the trial period
+enrollment_dates = random_dates(start_date, end_date, n_records)
+
+# Generate patient ages (18-80 years old)
+ages = rng.integers(18, 81, n_records)
+
+# Generate adverse event status (approximately 30% of patients)
+adverse_events = rng.random(n_records) < 0.3
+
+# Generate completion status with realistic probabilities
+# Patients with adverse events have lower completion rates:
+# 70% completion if adverse event, 90% completion otherwise
+completion_probability = np.where(adverse_events, 0.7, 0.9)
+completed_trials = rng.random(n_records) < completion_probability
+
+# Write all patient records to CSV in one go (booleans as lowercase true/false)
+pd.DataFrame({
+    "patient_id": patient_ids,
+    "trial_site": sites,
+    "enrollment_date": enrollment_dates,
+    "age": ages,
+    "adverse_event": np.where(adverse_events, "true", "false"),
+    "completed_trial": np.where(completed_trials, "true", "false")
+}).to_csv(output_file, index=False, date_format="%Y-%m-%d")
 
 # =============================================================================
 # COMPLETION MESSAGE
 # =============================================================================
 
-print(f"✅ CSV file '{output_file}' created successfully with {n_records} records.")
\ No newline at end of file
+print(f"✅ CSV file '{output_file}' created successfully with {n_records} records.")
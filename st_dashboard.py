@@ -17,24 +17,209 @@ through interactive charts, tables, and visualizations.
 import pandas as pd
 import streamlit as st
 import altair as alt
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 from scipy import stats
 from datetime import datetime
 
-# Import analytics functions from the analytics module
-from analytics import (
+# Import analytics functions through their Streamlit-cached wrappers, so reruns
+# triggered by widget interactions reuse earlier results
+from analytics_cached import (
     load_data, 
     calculate_summary_statistics, 
     site_performance_analysis, 
     age_group_analysis, 
     temporal_analysis, 
-    correlation_analysis, 
-    get_key_insights
+    correlation_analysis
 )
 
+# The outcome counts are a single bincount, cheaper than hashing their input arrays for
+# a cache lookup, so they are computed directly on every rerun
+from analytics import outcome_summary
+
+# Plotly config for charts with nothing to interact with: rendered as static images,
+# so plotly.js skips hover hit-testing, event wiring and the mode bar
+STATIC_CHART_CONFIG = {"staticPlot": True, "displayModeBar": False}
+
+# =============================================================================
+# FIGURE BUILDERS
+# =============================================================================
+# Each chart is built by a function that takes only the small arrays it plots. Every
+# argument is a NumPy array or scalar that Plotly takes as is; labels are fixed-width
+# string arrays (dtype=str) because object arrays do not hash by content.
+#
+# Single-trace figures are rebuilt on every rerun: that takes a few milliseconds, less
+# than st.cache_data needs to unpickle and revalidate a stored figure. Only the
+# make_subplots temporal figure is costly enough to cache, and it is held with
+# st.cache_resource (returned as is, never copied) since figures are not modified
+# after they are built.
+
+def _display_values(values):
+    """
+    Round plotted rates and correlations to 2 decimals and store them as float32.
+    Plotly ships NumPy arrays to the browser as binary buffers, so this halves their
+    size without any visible change at the precision the charts display.
+    """
+    return np.round(np.asarray(values, dtype=float), 2).astype(np.float32)
+
+
+def _integer_bin_edges(values, max_bins=10):
+    """
+    Histogram bin edges for integer data: about max_bins bins of the same integer
+    width, aligned to multiples of that width, so every bin covers the same number
+    of distinct values and bar heights reflect the distribution, not the bin width.
+    """
+    if len(values) == 0:
+        return np.arange(max_bins + 1)
+    lo, hi = int(values.min()), int(values.max())
+    step = max(1, -(-(hi - lo + 1) // max_bins))  # ceiling division
+    start = lo // step * step
+    n_bins = (hi - start) // step + 1
+    return start + step * np.arange(n_bins + 1)
+
+
+def build_age_histogram(counts, edges, avg_age):
+    """
+    Age distribution histogram with a dashed line at the average age. The bins are
+    counted server-side, so only the bar heights are sent to the browser.
+    """
+    fig = go.Figure(go.Bar(
+        x=0.5 * (edges[:-1] + edges[1:]),
+        y=counts,
+        width=np.diff(edges),
+        marker_color="#636EFA"
+    ))
+    fig.update_layout(
+        title="Age Distribution of Patients",
+        xaxis_title="Age",
+        yaxis_title="Count",
+        title_x=0.5
+    )
+    # Add vertical line showing average age
+    fig.add_vline(x=avg_age, line_dash="dash", line_color="red",
+                  annotation_text=f"Avg: {avg_age:.1f}", annotation_position="top left")
+    return fig
+
+
+def build_completion_pie(n_completed, n_total):
+    """Donut chart of completed vs not completed patients."""
+    fig = go.Figure(go.Pie(
+        labels=["Completed", "Not Completed"],
+        values=[n_completed, n_total - n_completed],
+        hole=0.4,
+        marker_colors=["#008000", "#FF0000"]
+    ))
+    fig.update_layout(title_text="Completion Rate")
+    return fig
+
+
+def build_adverse_event_pie(n_adverse_events, n_total):
+    """Donut chart of patients with and without adverse events."""
+    fig = go.Figure(go.Pie(
+        labels=["No", "Yes"],
+        values=[n_total - n_adverse_events, n_adverse_events],
+        hole=0.4,
+        marker_colors=["#FF0000", "#008000"]
+    ))
+    fig.update_layout(title_text="Adverse Event Rate")
+    return fig
+
+
+def build_completion_compare(rate_with_ae, rate_without_ae):
+    """Bar chart comparing completion rates with and without adverse events."""
+    # Label each bar with a plain f-string; a rate is undefined (NaN) when no patient
+    # falls in its group, and its bar is left unlabelled
+    rates = (rate_with_ae, rate_without_ae)
+    fig = go.Figure(go.Bar(
+        x=["Yes", "No"],
+        y=_display_values(rates),
+        text=["" if np.isnan(rate) else f"{rate:.1f}%" for rate in rates],
+        textposition="outside",
+        hoverinfo="skip",
+        marker_color=["#FF4136", "#2ECC40"]
+    ))
+    fig.update_layout(
+        title_text="Completion Rate: With vs Without Adverse Events",
+        xaxis_title="Adverse Event",
+        yaxis_title="Completion Rate (%)",
+        showlegend=False,
+        yaxis_range=[0, 100]
+    )
+    return fig
+
+
+def build_rate_bar(categories, rates, title, category_title, rate_title, color):
+    """
+    Single bar chart of one rate per category. Paired charts are laid out side by
+    side with st.columns rather than as make_subplots panels.
+    """
+    fig = go.Figure(go.Bar(x=categories, y=_display_values(rates), name=rate_title, marker_color=color))
+    fig.update_layout(height=400, showlegend=False, title_text=title,
+                      xaxis_title=category_title, yaxis_title=rate_title)
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def build_temporal_figure(months, enrollments, completion_rates, ae_rates):
+    """Monthly enrollments above monthly completion and adverse event rates."""
+    temporal_fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('Monthly Enrollments', 'Monthly Completion & Adverse Event Rates'),
+        specs=[[{"secondary_y": False}], [{"secondary_y": True}]]
+    )
+
+    # Add monthly enrollment bar chart (top panel)
+    temporal_fig.add_trace(
+        go.Bar(x=months, y=enrollments,
+               name='Enrollments', marker_color='#9B59B6'),
+        row=1, col=1
+    )
+
+    # Rate lines are drawn with WebGL (Scattergl), which keeps rendering fast if the
+    # temporal granularity ever grows from months to weeks or days
+    # Add monthly completion rate line chart (bottom panel, left y-axis)
+    temporal_fig.add_trace(
+        go.Scattergl(x=months, y=_display_values(completion_rates),
+                     mode='lines+markers', name='Completion Rate (%)', line=dict(color='#2ECC40')),
+        row=2, col=1
+    )
+
+    # Add monthly adverse event rate line chart (bottom panel, right y-axis)
+    temporal_fig.add_trace(
+        go.Scattergl(x=months, y=_display_values(ae_rates),
+                     mode='lines+markers', name='Adverse Event Rate (%)', line=dict(color='#E74C3C')),
+        row=2, col=1, secondary_y=True
+    )
+
+    # Update layout for better presentation
+    temporal_fig.update_layout(height=600, title_text="Temporal Analysis")
+    temporal_fig.update_xaxes(title_text="Month", row=2, col=1)
+    temporal_fig.update_yaxes(title_text="Number of Enrollments", row=1, col=1)
+    temporal_fig.update_yaxes(title_text="Completion Rate (%)", row=2, col=1)
+    temporal_fig.update_yaxes(title_text="Adverse Event Rate (%)", row=2, col=1, secondary_y=True)
+    return temporal_fig
+
+
+def build_correlation_heatmap(values, labels):
+    """
+    Annotated heatmap of the correlation matrix. Cell labels are formatted here in one
+    vectorized pass instead of by plotly.js; undefined correlations are left blank.
+    """
+    text = np.where(np.isnan(values), "", np.round(values, 2).astype(str))
+    fig = go.Figure(go.Heatmap(
+        z=_display_values(values),
+        x=labels,
+        y=labels,
+        text=text,
+        texttemplate="%{text}",
+        colorscale='RdBu_r',
+        zmid=0
+    ))
+    # List the first variable at the top, like a printed matrix
+    fig.update_layout(title_text="Correlation Matrix: Variable Relationships", yaxis_autorange="reversed")
+    return fig
+
 
 
 # =============================================================================
@@ -44,8 +229,21 @@ from analytics import (
 # Load and preprocess the clinical trial data
 df = load_data()
 
-# Calculate summary statistics for the dashboard
+# Extract the columns used by the charts as contiguous NumPy arrays once, so the
+# render path below works on plain arrays instead of going through pandas indexing
+ages = df["age"].to_numpy()
+completed = df["completed_trial"].to_numpy()
+adverse_events = df["adverse_event"].to_numpy()
+
+# load_data guarantees plain NumPy booleans; the fused outcome counts rely on it, and a
+# nullable or object column would silently fall back to pandas' slow masked path
+assert completed.dtype == np.bool_ and adverse_events.dtype == np.bool_, \
+    "completed_trial and adverse_event must be loaded as NumPy bool columns"
+
+# Calculate summary statistics for the dashboard, plus the outcome counts and rates,
+# which come from a single fused pass over the two boolean columns
 summary_stats = calculate_summary_statistics(df)
+outcomes = outcome_summary(completed, adverse_events)
 
 # =============================================================================
 # DASHBOARD HEADER AND SUMMARY STATISTICS
@@ -72,245 +270,142 @@ st.write("### Average Age:", int(summary_stats['average_age']))
 # VISUALIZATIONS AND CHARTS
 # =============================================================================
 
-# Create age distribution histogram with average line
-fig = px.histogram(
-    df,
-    x="age",
-    nbins=10,
-    title="Age Distribution of Patients",
-    color_discrete_sequence=["#636EFA"]
-)
-fig.update_layout(
-    xaxis_title="Age",
-    yaxis_title="Count",
-    title_x=0.5
-)
-# Add vertical line showing average age
-fig.add_vline(x=df["age"].mean(), line_dash="dash", line_color="red",
-              annotation_text=f"Avg: {df['age'].mean():.1f}", annotation_position="top left")
-st.plotly_chart(fig, use_container_width=True)
+# Create age distribution histogram with average line. About ten integer-aligned bins
+# are counted here with np.histogram, and the average is reused from the summary
+# statistics instead of scanning the age column again
+age_counts, age_edges = np.histogram(ages, bins=_integer_bin_edges(ages))
+fig = build_age_histogram(age_counts, age_edges, summary_stats['average_age'])
+st.plotly_chart(fig, width="stretch")
 
 # Display completion rate statistics
-st.write("### Completion Rate:", summary_stats['completion_rate'], "%")
-
-# Create completion status pie chart
-completion_count = df["completed_trial"].value_counts().reset_index()
-completion_count.columns = ["Status", "Count"]
-completion_count["Status"] = completion_count["Status"].map({True: "Completed", False: "Not Completed"})
-completion_fig = px.pie(
-    completion_count,
-    names = "Status",
-    values = "Count",
-    title="Completion Rate",
-    hole=0.4,
-    color_discrete_sequence=["#008000", "#FF0000"]
-)
-st.plotly_chart(completion_fig)
+st.write("### Completion Rate:", round(outcomes.completion_rate, 1), "%")
+
+# Create completion status pie chart from the outcome counts
+completion_fig = build_completion_pie(outcomes.completed, outcomes.total)
+st.plotly_chart(completion_fig, config=STATIC_CHART_CONFIG)
 
 # Display adverse event rate statistics
-st.write("### Adverse Event Rate:", summary_stats['adverse_event_rate'], "%")
-
-# Create adverse event pie chart
-adverse_event_count = df["adverse_event"].value_counts().reset_index()
-adverse_event_count.columns = ["Adverse Event", "Count"]
-adverse_event_count["Adverse Event"] = adverse_event_count["Adverse Event"].map({False: "No", True: "Yes"})
-adverse_event_fig = px.pie(
-    adverse_event_count,
-    names = "Adverse Event",
-    values = "Count",
-    title="Adverse Event Rate",
-    hole=0.4,
-    color_discrete_sequence=["#FF0000", "#008000"]
-)
-st.plotly_chart(adverse_event_fig)
+st.write("### Adverse Event Rate:", round(outcomes.adverse_event_rate, 1), "%")
+
+# Create adverse event pie chart from the outcome counts
+adverse_event_fig = build_adverse_event_pie(outcomes.adverse_events, outcomes.total)
+st.plotly_chart(adverse_event_fig, config=STATIC_CHART_CONFIG)
 
 # Display completion rates stratified by adverse event status
-st.write("### Completion Rate (Adverse Event = True):", round(summary_stats['completion_rate_with_ae'], 2))
-st.write("### Completion Rate (Adverse Event = False):", round(summary_stats['completion_rate_without_ae'], 2))
+st.write("### Completion Rate (Adverse Event = True):", round(outcomes.completion_rate_with_ae, 1))
+st.write("### Completion Rate (Adverse Event = False):", round(outcomes.completion_rate_without_ae, 1))
 
 # Create comparison bar chart for completion rates with/without adverse events
-completion_compare = pd.DataFrame({
-    "Adverse Event": ["Yes", "No"],
-    "Completion Rate (%)": [summary_stats['completion_rate_with_ae'], summary_stats['completion_rate_without_ae']]
-})
-
-fig = px.bar(
-    completion_compare,
-    x="Adverse Event",
-    y="Completion Rate (%)",
-    color="Adverse Event",
-    text=completion_compare["Completion Rate (%)"].round(1).astype(str) + "%",
-    title="Completion Rate: With vs Without Adverse Events",
-    color_discrete_sequence=["#FF4136", "#2ECC40"]
-)
-fig.update_traces(textposition="outside")
-fig.update_layout(showlegend=False, yaxis_range=[0, 100])
-st.plotly_chart(fig, use_container_width=True)
+fig = build_completion_compare(outcomes.completion_rate_with_ae, outcomes.completion_rate_without_ae)
+st.plotly_chart(fig, width="stretch", config=STATIC_CHART_CONFIG)
 
 # =============================================================================
 # ADVANCED ANALYSIS SECTION
 # =============================================================================
-
-# Add separator and section title
-st.write("---")
-st.title("Advanced Analysis & Insights")
-
-# Calculate all advanced analytics metrics
-site_performance = site_performance_analysis(df)
-age_analysis = age_group_analysis(df)
-temporal_stats = temporal_analysis(df)
-correlation_matrix = correlation_analysis(df)
-key_insights = get_key_insights(df)
-
-# Convert dictionaries to DataFrames for visualization
-# This is necessary because the analytics functions return dictionaries,
-# but Streamlit visualizations work better with DataFrames
-site_performance_df = pd.DataFrame.from_dict(site_performance, orient='index')
-age_analysis_df = pd.DataFrame.from_dict(age_analysis, orient='index')
-temporal_stats_df = pd.DataFrame.from_dict(temporal_stats, orient='index')
-correlation_df = pd.DataFrame.from_dict(correlation_matrix, orient='index')
-
-# =============================================================================
-# SITE PERFORMANCE ANALYSIS
-# =============================================================================
-
-st.write("## Site Performance Analysis")
-st.write("### Site Rankings by Completion Rate")
-
-# Create side-by-side comparison of site performance metrics
-site_fig = make_subplots(
-    rows=1, cols=2,
-    subplot_titles=('Completion Rate by Site', 'Adverse Event Rate by Site'),
-    specs=[[{"secondary_y": False}, {"secondary_y": False}]]
-)
-
-# Add completion rate bar chart (left subplot)
-site_fig.add_trace(
-    go.Bar(x=site_performance_df.index, y=site_performance_df['completion_rate'],
-           name='Completion Rate (%)', marker_color='#2ECC40'),
-    row=1, col=1
-)
-
-# Add adverse event rate bar chart (right subplot)
-site_fig.add_trace(
-    go.Bar(x=site_performance_df.index, y=site_performance_df['ae_rate'],
-           name='Adverse Event Rate (%)', marker_color='#FF4136'),
-    row=1, col=2
-)
-
-# Update layout for better presentation
-site_fig.update_layout(height=400, showlegend=False, title_text="Site Performance Comparison")
-site_fig.update_xaxes(title_text="Trial Site", row=1, col=1)
-site_fig.update_xaxes(title_text="Trial Site", row=1, col=2)
-site_fig.update_yaxes(title_text="Completion Rate (%)", row=1, col=1)
-site_fig.update_yaxes(title_text="Adverse Event Rate (%)", row=1, col=2)
-
-st.plotly_chart(site_fig, use_container_width=True)
-
-# Display detailed site statistics table
-st.write("### Detailed Site Statistics")
-st.dataframe(site_performance_df)
-
-# =============================================================================
-# AGE GROUP ANALYSIS
-# =============================================================================
-
-st.write("## Age Group Analysis")
-st.write("### Performance by Age Groups")
-
-# Create side-by-side comparison of age group performance
-age_fig = make_subplots(
-    rows=1, cols=2,
-    subplot_titles=('Completion Rate by Age Group', 'Adverse Event Rate by Age Group'),
-    specs=[[{"secondary_y": False}, {"secondary_y": False}]]
-)
-
-# Add completion rate bar chart for age groups (left subplot)
-age_fig.add_trace(
-    go.Bar(x=age_analysis_df.index, y=age_analysis_df['completion_rate'],
-           name='Completion Rate (%)', marker_color='#3498DB'),
-    row=1, col=1
-)
-
-# Add adverse event rate bar chart for age groups (right subplot)
-age_fig.add_trace(
-    go.Bar(x=age_analysis_df.index, y=age_analysis_df['ae_rate'],
-           name='Adverse Event Rate (%)', marker_color='#E74C3C'),
-    row=1, col=2
-)
-
-# Update layout for better presentation
-age_fig.update_layout(height=400, showlegend=False, title_text="Age Group Performance Analysis")
-age_fig.update_xaxes(title_text="Age Group", row=1, col=1)
-age_fig.update_xaxes(title_text="Age Group", row=1, col=2)
-age_fig.update_yaxes(title_text="Completion Rate (%)", row=1, col=1)
-age_fig.update_yaxes(title_text="Adverse Event Rate (%)", row=1, col=2)
-
-st.plotly_chart(age_fig, use_container_width=True)
-
-# Display detailed age group statistics table
-st.write("### Age Group Statistics")
-st.dataframe(age_analysis_df)
-
-# =============================================================================
-# TEMPORAL TRENDS ANALYSIS
-# =============================================================================
-
-st.write("## Temporal Trends Analysis")
-st.write("### Monthly Enrollment and Performance Trends")
-
-# Create multi-panel temporal analysis visualization
-temporal_fig = make_subplots(
-    rows=2, cols=1,
-    subplot_titles=('Monthly Enrollments', 'Monthly Completion & Adverse Event Rates'),
-    specs=[[{"secondary_y": False}], [{"secondary_y": True}]]
-)
-
-# Add monthly enrollment bar chart (top panel)
-temporal_fig.add_trace(
-    go.Bar(x=temporal_stats_df.index, y=temporal_stats_df['enrollments'],
-           name='Enrollments', marker_color='#9B59B6'),
-    row=1, col=1
-)
-
-# Add monthly completion rate line chart (bottom panel, left y-axis)
-temporal_fig.add_trace(
-    go.Scatter(x=temporal_stats_df.index, y=temporal_stats_df['completion_rate'],
-               mode='lines+markers', name='Completion Rate (%)', line=dict(color='#2ECC40')),
-    row=2, col=1
-)
-
-# Add monthly adverse event rate line chart (bottom panel, right y-axis)
-temporal_fig.add_trace(
-    go.Scatter(x=temporal_stats_df.index, y=temporal_stats_df['ae_rate'],
-               mode='lines+markers', name='Adverse Event Rate (%)', line=dict(color='#E74C3C')),
-    row=2, col=1, secondary_y=True
-)
-
-# Update layout for better presentation
-temporal_fig.update_layout(height=600, title_text="Temporal Analysis")
-temporal_fig.update_xaxes(title_text="Month", row=2, col=1)
-temporal_fig.update_yaxes(title_text="Number of Enrollments", row=1, col=1)
-temporal_fig.update_yaxes(title_text="Completion Rate (%)", row=2, col=1)
-temporal_fig.update_yaxes(title_text="Adverse Event Rate (%)", row=2, col=1, secondary_y=True)
-
-st.plotly_chart(temporal_fig, use_container_width=True)
-
-# =============================================================================
-# CORRELATION ANALYSIS
-# =============================================================================
-
-st.write("## Correlation Analysis")
-st.write("### Variable Relationships Heatmap")
-
-# Create correlation matrix heatmap showing relationships between all variables
-corr_fig = px.imshow(correlation_df, 
-                     text_auto=True, 
-                     aspect="auto",
-                     color_continuous_scale='RdBu_r',
-                     title="Correlation Matrix: Variable Relationships")
-
-st.plotly_chart(corr_fig, use_container_width=True)
-
-
-
+# Rendered as an st.fragment, so widget interactions inside the section rerun only this
+# function instead of the whole script. Each analysis sits in a collapsed expander that
+# tracks its open state; its analysis only runs and its figures are only built and sent
+# while it is open, and the cached analytics make reopening it cheap.
+
+@st.fragment
+def render_advanced_analysis(df):
+    """Render the site, age group, temporal and correlation analyses for df."""
+    # Add separator and section title
+    st.write("---")
+    st.title("Advanced Analysis & Insights")
+
+    # -------------------------------------------------------------------------
+    # SITE PERFORMANCE ANALYSIS
+    # -------------------------------------------------------------------------
+
+    with st.expander("Site Performance Analysis", key="site_section", on_change="rerun") as section:
+        if section.open:
+            st.write("### Site Rankings by Completion Rate")
+
+            # Analyses are requested as DataFrames, which is what the charts and tables
+            # below work with, so no dictionary round trip is needed
+            site_performance_df = site_performance_analysis(df, as_frame=True)
+
+            # Create side-by-side comparison of site performance metrics
+            sites = site_performance_df.index.to_numpy(dtype=str)
+            site_completion_rates = site_performance_df['completion_rate'].to_numpy()
+            site_ae_rates = site_performance_df['ae_rate'].to_numpy()
+            site_col1, site_col2 = st.columns(2)
+            with site_col1:
+                # Completion rate per site (left column)
+                st.plotly_chart(build_rate_bar(sites, site_completion_rates,
+                                               'Completion Rate by Site', 'Trial Site', 'Completion Rate (%)', '#2ECC40'),
+                                width="stretch")
+            with site_col2:
+                # Adverse event rate per site (right column)
+                st.plotly_chart(build_rate_bar(sites, site_ae_rates,
+                                               'Adverse Event Rate by Site', 'Trial Site', 'Adverse Event Rate (%)', '#FF4136'),
+                                width="stretch")
+
+            # Display detailed site statistics table
+            st.write("### Detailed Site Statistics")
+            st.dataframe(site_performance_df)
+
+    # -------------------------------------------------------------------------
+    # AGE GROUP ANALYSIS
+    # -------------------------------------------------------------------------
+
+    with st.expander("Age Group Analysis", key="age_section", on_change="rerun") as section:
+        if section.open:
+            st.write("### Performance by Age Groups")
+
+            age_analysis_df = age_group_analysis(df, as_frame=True)
+
+            # Create side-by-side comparison of age group performance
+            age_groups = age_analysis_df.index.to_numpy(dtype=str)
+            age_completion_rates = age_analysis_df['completion_rate'].to_numpy()
+            age_ae_rates = age_analysis_df['ae_rate'].to_numpy()
+            age_col1, age_col2 = st.columns(2)
+            with age_col1:
+                # Completion rate per age group (left column)
+                st.plotly_chart(build_rate_bar(age_groups, age_completion_rates,
+                                               'Completion Rate by Age Group', 'Age Group', 'Completion Rate (%)', '#3498DB'),
+                                width="stretch")
+            with age_col2:
+                # Adverse event rate per age group (right column)
+                st.plotly_chart(build_rate_bar(age_groups, age_ae_rates,
+                                               'Adverse Event Rate by Age Group', 'Age Group', 'Adverse Event Rate (%)', '#E74C3C'),
+                                width="stretch")
+
+            # Display detailed age group statistics table
+            st.write("### Age Group Statistics")
+            st.dataframe(age_analysis_df)
+
+    # -------------------------------------------------------------------------
+    # TEMPORAL TRENDS ANALYSIS
+    # -------------------------------------------------------------------------
+
+    with st.expander("Temporal Trends Analysis", key="temporal_section", on_change="rerun") as section:
+        if section.open:
+            st.write("### Monthly Enrollment and Performance Trends")
+
+            # Create multi-panel temporal analysis visualization
+            temporal_stats_df = temporal_analysis(df, as_frame=True)
+            temporal_fig = build_temporal_figure(
+                temporal_stats_df.index.to_numpy(),
+                temporal_stats_df['enrollments'].to_numpy(),
+                temporal_stats_df['completion_rate'].to_numpy(),
+                temporal_stats_df['ae_rate'].to_numpy()
+            )
+            st.plotly_chart(temporal_fig, width="stretch")
+
+    # -------------------------------------------------------------------------
+    # CORRELATION ANALYSIS
+    # -------------------------------------------------------------------------
+
+    with st.expander("Correlation Analysis", key="correlation_section", on_change="rerun") as section:
+        if section.open:
+            st.write("### Variable Relationships Heatmap")
+
+            # Create correlation matrix heatmap showing relationships between all variables
+            correlation_df = correlation_analysis(df, as_frame=True)
+            corr_fig = build_correlation_heatmap(correlation_df.to_numpy(), correlation_df.columns.to_numpy(dtype=str))
+            st.plotly_chart(corr_fig, width="stretch")
+
+
+render_advanced_analysis(df)
@@ -0,0 +1,74 @@
+"""
+Regression tests for the analytics module.
+
+Run from the project root with:
+    python -m unittest
+"""
+
+import io
+import unittest
+from unittest import mock
+
+import analytics
+
+
+def _csv(rows):
+    """Build an in-memory CSV upload from data rows (header included)."""
+    header = "patient_id,trial_site,enrollment_date,age,adverse_event,completed_trial\n"
+    return io.BytesIO((header + "\n".join(rows) + "\n").encode())
+
+
+class LoadDataBooleanTests(unittest.TestCase):
+    """Outcome columns accept padded and mixed-case spellings of true/yes/1."""
+
+    ROWS = [
+        "P001,Boston,2024-01-02,40, true,True ",
+        "P002,Dallas,2024-02-03,60,tRuE,false",
+        "P003,Boston,2024-03-03,30, yes ,1",
+        "P004,Dallas,2024-03-04,33,No,YES",
+        "P005,Dallas,2024-03-05,45,0,FALSE",
+    ]
+    EXPECTED_AE = [True, True, True, False, False]
+    EXPECTED_COMPLETED = [True, False, True, True, False]
+
+    def check(self, df):
+        self.assertEqual(df['adverse_event'].dtype, bool)
+        self.assertEqual(df['completed_trial'].dtype, bool)
+        self.assertEqual(df['adverse_event'].tolist(), self.EXPECTED_AE)
+        self.assertEqual(df['completed_trial'].tolist(), self.EXPECTED_COMPLETED)
+
+    def test_default_reader(self):
+        self.check(analytics.load_data(_csv(self.ROWS)))
+
+    def test_pandas_fallback_reader(self):
+        with mock.patch.object(analytics, 'pa_csv', None):
+            self.check(analytics.load_data(_csv(self.ROWS)))
+
+
+class LoadDataNullValueTests(unittest.TestCase):
+    """pandas' default NA markers and the project's extra ones count as missing data."""
+
+    ROWS = [
+        "P001,Boston,2024-01-02,40,true,true",
+        "P002,#N/A,2024-02-03,60,false,true",
+        "P003,Dallas,2024-03-03,-nan,false,true",
+        "P004,Dallas,2024-03-04,1.#QNAN,false,true",
+        "P005,#N/A N/A,2024-03-05,45,false,true",
+        "P006,Dallas,2024-03-06,Null,false,true",
+        "P007,Dallas,2024-03-07,50,true,false",
+    ]
+
+    def check(self, df):
+        self.assertEqual(df['patient_id'].tolist(), ['P001', 'P007'])
+        self.assertEqual(sorted(df['trial_site'].cat.categories), ['Boston', 'Dallas'])
+
+    def test_default_reader(self):
+        self.check(analytics.load_data(_csv(self.ROWS)))
+
+    def test_pandas_fallback_reader(self):
+        with mock.patch.object(analytics, 'pa_csv', None):
+            self.check(analytics.load_data(_csv(self.ROWS)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+"""
+Clinical Trials Analytics WSGI Entry Point
+
+Exposes the Flask application for production WSGI servers. Run it with gunicorn, e.g.:
+
+    gunicorn -w 4 --threads 2 --preload -b 0.0.0.0:8000 wsgi:app
+
+With --preload the module is imported once in the gunicorn master before the workers
+are forked, so the default data set loaded below is already cached in every worker
+through copy-on-write memory. Its Parquet cache next to the CSV lets restarted
+workers skip the CSV parse as well, and once one worker has re-read an updated CSV,
+the others load the new version from Parquet too.
+"""
+
+import logging
+
+from analytics import load_data
+from api import app
+
+logger = logging.getLogger(__name__)
+
+# Warm the data cache before the workers fork; a missing or invalid default file
+# should not prevent the API from serving uploads
+try:
+    load_data()
+except Exception as e:
+    logger.warning(f"Could not preload default data: {str(e)}")